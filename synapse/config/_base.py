@@ -16,11 +16,12 @@
 
 import argparse
 import errno
+import functools
 import os
 from collections import OrderedDict
 from hashlib import sha256
 from textwrap import dedent
-from typing import Any, Iterable, List, MutableMapping, Optional, Union
+from typing import Any, Iterable, List, MutableMapping, Optional, Tuple, Union
 
 import attr
 import jinja2
@@ -275,25 +276,48 @@ class Config:
             # Search the custom template directory as well
             search_directories.insert(0, custom_template_directory)
 
-        # TODO: switch to synapse.util.templates.build_jinja_env
-        loader = jinja2.FileSystemLoader(search_directories)
-        env = jinja2.Environment(
-            loader=loader,
-            autoescape=jinja2.select_autoescape(),
-        )
-
-        # Update the environment with our custom filters
-        env.filters.update(
-            {
-                "format_ts": _format_ts_filter,
-                "mxc_to_http": _create_mxc_to_http_filter(self.public_baseurl),
-            }
-        )
+        env = _build_templates_env(tuple(search_directories), self.public_baseurl)
 
         # Load the templates
         return [env.get_template(filename) for filename in filenames]
 
 
+@functools.lru_cache(maxsize=None)
+def _build_templates_env(
+    search_directories: Tuple[str, ...], public_baseurl: Optional[str]
+) -> jinja2.Environment:
+    """Build the Jinja environment used to load templates from the given directories.
+
+    Environments are cached so that configs reading templates from the same
+    directories share them, along with the templates they have already compiled.
+    Jinja still checks whether a template has changed on disk before reusing it.
+
+    Args:
+        search_directories: The directories to look for templates in, in order.
+        public_baseurl: The public base URL of the homeserver, used by the
+            `mxc_to_http` filter.
+
+    Returns:
+        A jinja2 environment.
+    """
+    # TODO: switch to synapse.util.templates.build_jinja_env
+    loader = jinja2.FileSystemLoader(search_directories)
+    env = jinja2.Environment(
+        loader=loader,
+        autoescape=jinja2.select_autoescape(),
+    )
+
+    # Update the environment with our custom filters
+    env.filters.update(
+        {
+            "format_ts": _format_ts_filter,
+            "mxc_to_http": _create_mxc_to_http_filter(public_baseurl),
+        }
+    )
+
+    return env
+
+
 class RootConfig:
     """
     Holder of an application's configuration.
@@ -19,31 +19,36 @@ class AccountValidityConfig(Config):
     section = "account_validity"
 
     def read_config(self, config, **kwargs):
-        account_validity_config = config.get("account_validity") or {}
+        self.account_validity_enabled = False
+        self.account_validity_renew_by_email_enabled = False
+
+        # The templates are only used by the renewal servlet, which loads the
+        # default templates itself on first use if account validity isn't configured.
+        self.account_validity_account_renewed_template = None
+        self.account_validity_account_previously_renewed_template = None
+        self.account_validity_invalid_token_template = None
+
+        account_validity_config = config.get("account_validity")
+        if not account_validity_config:
+            return
+
         self.account_validity_enabled = account_validity_config.get("enabled", False)
-        self.account_validity_renew_by_email_enabled = (
-            "renew_at" in account_validity_config
-        )
+
+        renew_at = account_validity_config.get("renew_at")
+        self.account_validity_renew_by_email_enabled = renew_at is not None
 
         if self.account_validity_enabled:
-            if "period" in account_validity_config:
-                self.account_validity_period = self.parse_duration(
-                    account_validity_config["period"]
-                )
-            else:
+            period = account_validity_config.get("period")
+            if period is None:
                 raise ConfigError("'period' is required when using account validity")
+            self.account_validity_period = self.parse_duration(period)
+
+            if renew_at is not None:
+                self.account_validity_renew_at = self.parse_duration(renew_at)
 
-            if "renew_at" in account_validity_config:
-                self.account_validity_renew_at = self.parse_duration(
-                    account_validity_config["renew_at"]
-                )
-
-            if "renew_email_subject" in account_validity_config:
-                self.account_validity_renew_email_subject = account_validity_config[
-                    "renew_email_subject"
-                ]
-            else:
-                self.account_validity_renew_email_subject = "Renew your %(app)s account"
+            self.account_validity_renew_email_subject = account_validity_config.get(
+                "renew_email_subject", "Renew your %(app)s account"
+            )
 
             self.account_validity_startup_job_max_delta = (
                 self.account_validity_period * 10.0 / 100.0
@@ -126,16 +126,18 @@ class DirectoryHandler(BaseHandler):
                     errcode=Codes.EXCLUSIVE,
                 )
         else:
-            # Server admins are not subject to the same constraints as normal
-            # users when creating an alias (e.g. being in the room).
-            is_admin = await self.auth.is_server_admin(requester.user)
-
-            if (self.require_membership and check_membership) and not is_admin:
-                rooms_for_user = await self.store.get_rooms_for_user(user_id)
-                if room_id not in rooms_for_user:
-                    raise AuthError(
-                        403, "You must be in the room to create an alias for it"
-                    )
+            if self.require_membership and check_membership:
+                # Server admins are not subject to the same constraints as normal
+                # users when creating an alias (e.g. being in the room). Only look
+                # this up if it matters.
+                is_admin = await self.auth.is_server_admin(requester.user)
+
+                if not is_admin:
+                    rooms_for_user = await self.store.get_rooms_for_user(user_id)
+                    if room_id not in rooms_for_user:
+                        raise AuthError(
+                            403, "You must be in the room to create an alias for it"
+                        )
 
             if not await self.spam_checker.user_may_create_room_alias(
                 user_id, room_alias
@@ -13,7 +13,9 @@
 # limitations under the License.
 
 
+import functools
 import logging
+from typing import Dict
 
 from synapse.api.errors import (
     AuthError,
@@ -25,9 +27,31 @@ from synapse.api.errors import (
 from synapse.http.servlet import RestServlet, parse_json_object_from_request
 from synapse.rest.client.v2_alpha._base import client_patterns
 from synapse.types import RoomAlias
+from synapse.util.caches.expiringcache import ExpiringCache
 
 logger = logging.getLogger(__name__)
 
+# How long, in milliseconds, to cache whether a room is published in the room
+# directory for. Expired entries are pruned every half of this, so an entry may
+# live for up to one and a half times as long.
+#
+# Entries are only invalidated when the room list entry is edited through
+# ClientDirectoryListServer. Other writers (room upgrades, the module API,
+# tombstoned rooms being removed from the directory, other workers) don't
+# invalidate the cache, so GET /directory/list/room may return a stale
+# visibility for that long after those.
+_ROOM_VISIBILITY_CACHE_EXPIRY_MS = 5000
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_room_alias_from_string(room_alias: str) -> RoomAlias:
+    """Parse a room alias, caching the result.
+
+    RoomAlias is immutable, so the parsed object can be shared between requests.
+    The cache is bounded since the aliases come straight from the request path.
+    """
+    return RoomAlias.from_string(room_alias)
+
 
 def register_servlets(hs, http_server):
     ClientDirectoryServer(hs).register(http_server)
@@ -45,14 +69,14 @@ class ClientDirectoryServer(RestServlet):
         self.auth = hs.get_auth()
 
     async def on_GET(self, request, room_alias):
-        room_alias = RoomAlias.from_string(room_alias)
+        room_alias = _cached_room_alias_from_string(room_alias)
 
         res = await self.directory_handler.get_association(room_alias)
 
         return 200, res
 
     async def on_PUT(self, request, room_alias):
-        room_alias = RoomAlias.from_string(room_alias)
+        room_alias = _cached_room_alias_from_string(room_alias)
 
         content = parse_json_object_from_request(request)
         if "room_id" not in content:
@@ -60,14 +84,17 @@ class ClientDirectoryServer(RestServlet):
                 400, 'Missing params: ["room_id"]', errcode=Codes.BAD_JSON
             )
 
-        logger.debug("Got content: %s", content)
-        logger.debug("Got room name: %s", room_alias.to_string())
-
         room_id = content["room_id"]
-        servers = content["servers"] if "servers" in content else None
+        servers = content.get("servers")
 
-        logger.debug("Got room_id: %s", room_id)
-        logger.debug("Got servers: %s", servers)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "PUT /directory/room alias=%s room_id=%s servers=%s content=%s",
+                room_alias.to_string(),
+                room_id,
+                servers,
+                content,
+            )
 
         # TODO(erikj): Check types.
 
@@ -84,9 +111,10 @@ class ClientDirectoryServer(RestServlet):
         return 200, {}
 
     async def on_DELETE(self, request, room_alias):
+        room_alias = _cached_room_alias_from_string(room_alias)
+
         try:
             service = self.auth.get_appservice_by_req(request)
-            room_alias = RoomAlias.from_string(room_alias)
             await self.directory_handler.delete_appservice_association(
                 service, room_alias
             )
@@ -103,8 +131,6 @@ class ClientDirectoryServer(RestServlet):
         requester = await self.auth.get_user_by_req(request)
         user = requester.user
 
-        room_alias = RoomAlias.from_string(room_alias)
-
         await self.directory_handler.delete_association(requester, room_alias)
 
         logger.info(
@@ -123,12 +149,34 @@ class ClientDirectoryListServer(RestServlet):
         self.directory_handler = hs.get_directory_handler()
         self.auth = hs.get_auth()
 
+        # Map from room ID to whether the room is published, so that bursts of
+        # lookups from room directory clients don't each hit the database.
+        self._visibility_cache = ExpiringCache(
+            "directory_room_visibility",
+            hs.get_clock(),
+            max_len=1024,
+            expiry_ms=_ROOM_VISIBILITY_CACHE_EXPIRY_MS,
+        )  # type: ExpiringCache[str, bool]
+
+        # Map from room ID to the number of times its visibility has been edited
+        # through this servlet. A lookup which raced with an edit must not put the
+        # value it read from the database back into the cache.
+        self._visibility_edit_counts = {}  # type: Dict[str, int]
+
     async def on_GET(self, request, room_id):
-        room = await self.store.get_room(room_id)
-        if room is None:
-            raise NotFoundError("Unknown room")
+        is_public = self._visibility_cache.get(room_id, None)
+        if is_public is None:
+            edit_count = self._visibility_edit_counts.get(room_id, 0)
 
-        return 200, {"visibility": "public" if room["is_public"] else "private"}
+            room = await self.store.get_room(room_id)
+            if room is None:
+                raise NotFoundError("Unknown room")
+
+            is_public = bool(room["is_public"])
+            if self._visibility_edit_counts.get(room_id, 0) == edit_count:
+                self._visibility_cache[room_id] = is_public
+
+        return 200, {"visibility": "public" if is_public else "private"}
 
     async def on_PUT(self, request, room_id):
         requester = await self.auth.get_user_by_req(request)
@@ -139,6 +187,7 @@ class ClientDirectoryListServer(RestServlet):
         await self.directory_handler.edit_published_room_list(
             requester, room_id, visibility
         )
+        self._invalidate_visibility(room_id)
 
         return 200, {}
 
@@ -148,9 +197,17 @@ class ClientDirectoryListServer(RestServlet):
         await self.directory_handler.edit_published_room_list(
             requester, room_id, "private"
         )
+        self._invalidate_visibility(room_id)
 
         return 200, {}
 
+    def _invalidate_visibility(self, room_id: str) -> None:
+        """Drop the cached visibility of a room after it has been edited."""
+        self._visibility_edit_counts[room_id] = (
+            self._visibility_edit_counts.get(room_id, 0) + 1
+        )
+        self._visibility_cache.pop(room_id, None)
+
 
 class ClientAppserviceDirectoryListServer(RestServlet):
     PATTERNS = client_patterns(
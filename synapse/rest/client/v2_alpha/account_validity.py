@@ -46,11 +46,35 @@ class AccountValidityRenewServlet(RestServlet):
             hs.config.account_validity.account_validity_invalid_token_template
         )
 
+    def _ensure_templates_loaded(self):
+        """Load the default renewal templates if the config didn't.
+
+        The account validity config skips loading them if there's no account_validity
+        section, but renewal links which were sent out before it was removed should
+        still get a page back.
+        """
+        if self.invalid_token_template is not None:
+            return
+
+        (
+            self.account_renewed_template,
+            self.account_previously_renewed_template,
+            self.invalid_token_template,
+        ) = self.hs.config.read_templates(
+            [
+                "account_renewed.html",
+                "account_previously_renewed.html",
+                "invalid_token.html",
+            ]
+        )
+
     async def on_GET(self, request):
         if b"token" not in request.args:
             raise SynapseError(400, "Missing renewal token")
         renewal_token = request.args[b"token"][0]
 
+        self._ensure_templates_loaded()
+
         (
             token_valid,
             token_stale,
@@ -0,0 +1,31 @@
+# Copyright 2021 The Matrix.org Foundation C.I.C.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from synapse.config.homeserver import HomeServerConfig
+
+from tests.unittest import TestCase
+from tests.utils import default_config
+
+
+class AccountValidityConfigTestCase(TestCase):
+    def test_templates_not_loaded_when_unconfigured(self):
+        config = HomeServerConfig()
+        config.parse_config_dict(default_config("test"), "", "")
+        config_obj = config.account_validity
+
+        self.assertFalse(config_obj.account_validity_enabled)
+        self.assertIsNone(config_obj.account_validity_account_renewed_template)
+        self.assertIsNone(
+            config_obj.account_validity_account_previously_renewed_template
+        )
+        self.assertIsNone(config_obj.account_validity_invalid_token_template)
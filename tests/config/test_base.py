@@ -79,3 +79,20 @@ class BaseConfigTestCase(unittest.HomeserverTestCase):
             self.hs.config.read_templates(
                 ["some_filename.html"], "a_nonexistent_directory"
             )
+
+    def test_loading_templates_is_cached(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with tempfile.NamedTemporaryFile(dir=tmp_dir) as tmp_template:
+                template_filename = os.path.basename(tmp_template.name)
+                tmp_template.write(b"{{ test_variable }}")
+                tmp_template.flush()
+
+                template1 = self.hs.config.read_templates([template_filename], tmp_dir)[
+                    0
+                ]
+                template2 = self.hs.config.read_templates([template_filename], tmp_dir)[
+                    0
+                ]
+
+        # The template should only have been compiled once.
+        self.assertIs(template1, template2)
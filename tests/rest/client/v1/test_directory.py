@@ -13,7 +13,11 @@
 # limitations under the License.
 
 import json
+from unittest.mock import patch
 
+from twisted.internet import defer
+
+from synapse.logging.context import make_deferred_yieldable
 from synapse.rest import admin
 from synapse.rest.client.v1 import directory, login, room
 from synapse.types import RoomAlias
@@ -108,6 +112,85 @@ class DirectoryTestCase(unittest.HomeserverTestCase):
         )
         self.assertEqual(channel.code, 200, channel.result)
 
+    def test_delete_malformed_alias(self):
+        # The alias is validated before the requester is authenticated, as with
+        # GET and PUT, so a malformed alias is rejected even without a token.
+        channel = self.make_request(
+            "DELETE", "/_matrix/client/r0/directory/room/not_an_alias"
+        )
+        self.assertEqual(channel.code, 400, channel.result)
+        self.assertEqual(channel.json_body["errcode"], "M_INVALID_PARAM")
+
+    def test_room_visibility(self):
+        url = "/_matrix/client/r0/directory/list/room/%s" % (self.room_id,)
+
+        channel = self.make_request("GET", url)
+        self.assertEqual(channel.code, 200, channel.result)
+        self.assertEqual(channel.json_body["visibility"], "private")
+
+        # Publishing the room should be visible straight away, despite the
+        # previous lookup having been cached.
+        channel = self.make_request(
+            "PUT",
+            url,
+            json.dumps({"visibility": "public"}),
+            access_token=self.room_owner_tok,
+        )
+        self.assertEqual(channel.code, 200, channel.result)
+
+        channel = self.make_request("GET", url)
+        self.assertEqual(channel.code, 200, channel.result)
+        self.assertEqual(channel.json_body["visibility"], "public")
+
+        channel = self.make_request("DELETE", url, access_token=self.room_owner_tok)
+        self.assertEqual(channel.code, 200, channel.result)
+
+        channel = self.make_request("GET", url)
+        self.assertEqual(channel.code, 200, channel.result)
+        self.assertEqual(channel.json_body["visibility"], "private")
+
+    def test_room_visibility_edited_during_lookup(self):
+        url = "/_matrix/client/r0/directory/list/room/%s" % (self.room_id,)
+
+        # Block the first room lookup after it has read from the database.
+        store = self.hs.get_datastore()
+        get_room = store.get_room
+        blocked = [defer.Deferred()]
+
+        async def get_room_blocking(room_id):
+            room = await get_room(room_id)
+            if blocked:
+                await make_deferred_yieldable(blocked.pop())
+            return room
+
+        with patch.object(store, "get_room", get_room_blocking):
+            lookup = self.make_request("GET", url, await_result=False)
+            d = blocked[0]
+
+            # Publish the room while the lookup is in progress.
+            channel = self.make_request(
+                "PUT",
+                url,
+                json.dumps({"visibility": "public"}),
+                access_token=self.room_owner_tok,
+            )
+            self.assertEqual(channel.code, 200, channel.result)
+
+            d.callback(None)
+            lookup.await_result()
+            self.assertEqual(lookup.code, 200, lookup.result)
+
+        # The stale value read by the racing lookup must not have been cached.
+        channel = self.make_request("GET", url)
+        self.assertEqual(channel.code, 200, channel.result)
+        self.assertEqual(channel.json_body["visibility"], "public")
+
+    def test_room_visibility_unknown_room(self):
+        channel = self.make_request(
+            "GET", "/_matrix/client/r0/directory/list/room/!unknown:test"
+        )
+        self.assertEqual(channel.code, 404, channel.result)
+
     def set_alias_via_state_event(self, expected_code, alias_length=5):
         url = "/_matrix/client/r0/rooms/%s/state/m.room.aliases/%s" % (
             self.room_id,
@@ -701,6 +701,26 @@ class AccountValidityRenewalByEmailTestCase(unittest.HomeserverTestCase):
         self.assertEqual(len(self.email_attempts), 1)
 
 
+class AccountValidityUnconfiguredTestCase(unittest.HomeserverTestCase):
+
+    servlets = [account_validity.register_servlets]
+
+    def test_renewal_invalid_token(self):
+        # The renewal endpoint is still served if account validity isn't configured,
+        # so that renewal links sent out before then still get a page back.
+        url = "/_matrix/client/unstable/account_validity/renew?token=123"
+        channel = self.make_request(b"GET", url)
+        self.assertEquals(channel.result["code"], b"404", channel.result)
+
+        content_type = channel.headers.getRawHeaders(b"Content-Type")
+        self.assertEqual(content_type, [b"text/html; charset=utf-8"], channel.result)
+
+        expected_html = self.hs.config.read_template("invalid_token.html").render()
+        self.assertEqual(
+            channel.result["body"], expected_html.encode("utf8"), channel.result
+        )
+
+
 class AccountValidityBackgroundJobTestCase(unittest.HomeserverTestCase):
 
     servlets = [synapse.rest.admin.register_servlets_for_client_rest_resource]